@@ -10,13 +10,28 @@ from models.question_generator import QuestionGenerator
 from models.physical_analyzer import PhysicalAnalyzer
 from models.interview_db import InterviewDatabase
 from utils.helpers import allowed_file, calculate_score, clean_text
+from utils.constants import CORS_HEADERS
+from utils.json_provider import OrjsonProvider, ORJSON_SUPPORT
 import secrets
 import ssl
+try:
+    from flask_compress import Compress
+    COMPRESS_SUPPORT = True
+except ImportError:
+    COMPRESS_SUPPORT = False
 import random
 
 app = Flask(__name__)
 app.config.from_object(Config)
 
+# Gzip large JSON/HTML responses (e.g. /analyze_physical, /results)
+if COMPRESS_SUPPORT:
+    Compress(app)
+
+# Serialize jsonify responses (e.g. per-frame /update_physical_analysis) with orjson
+if ORJSON_SUPPORT:
+    app.json = OrjsonProvider(app)
+
 # Create upload directory
 os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
 
@@ -31,9 +46,7 @@ interview_db = InterviewDatabase()
 # Add CORS headers for microphone access
 @app.after_request
 def after_request(response):
-    response.headers.add('Access-Control-Allow-Origin', '*')
-    response.headers.add('Access-Control-Allow-Headers', 'Content-Type,Authorization')
-    response.headers.add('Access-Control-Allow-Methods', 'GET,PUT,POST,DELETE,OPTIONS')
+    response.headers.update(CORS_HEADERS)
     return response
 
 # Debug small probe logger for .well-known requests (quiet unless matched)
@@ -390,14 +403,15 @@ def analyze_resume():
         file = request.files['resume']
         if file and allowed_file(file.filename):
             try:
-                # Save file
+                # Analyze resume from the upload stream (spooled by Werkzeug), not a saved copy
+                analysis = resume_analyzer.analyze_resume_stream(file.stream, file.filename)
+                
+                # Keep a copy of the upload
                 filename = secrets.token_hex(8) + '_' + file.filename
                 filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
+                file.stream.seek(0)
                 file.save(filepath)
                 
-                # Analyze resume
-                analysis = resume_analyzer.analyze_resume_file(filepath)
-                
                 # Store analysis in session
                 session['resume_analysis'] = analysis
                 session['resume_file'] = filename
@@ -612,8 +626,10 @@ def submit_answer():
     job_role = session['job_role']
     resume_analysis = session.get('resume_analysis', {})
     
-    # Get physical analysis data if available
-    physical_data = session.get('physical_analysis', {}).get(f'question_{current_q}', {})
+    # Get physical analysis data if available (keyed by question index)
+    physical_store = session.get('physical_analysis', {})
+    q_key = str(current_q)
+    physical_data = physical_store.get(q_key, {})
     
     # Analyze the answer
     score, feedback, detailed_analysis = ai_interviewer.analyze_answer(
@@ -658,15 +674,10 @@ def submit_answer():
         response_data['physical_analysis'] = physical_data
     
     session['responses'].append(response_data)
-    
-    # Save responses to database
     interview_id = session.get('interview_id')
-    if interview_id:
-        interview_db.save_responses(interview_id, session['responses'])
     
     # Clear physical analysis for next question
-    if f'question_{current_q}' in session.get('physical_analysis', {}):
-        session['physical_analysis'].pop(f'question_{current_q}', None)
+    physical_store.pop(q_key, None)
     
     session['score'] += score
     session['current_question'] += 1
@@ -675,11 +686,15 @@ def submit_answer():
     target_total = session.get('total_questions_target', len(questions))
     completed = session['current_question'] >= target_total
 
-    # If completed, save final results to database
-    if completed and interview_id:
-        avg_score = session['score'] / len(session['responses']) if session['responses'] else 0
-        interview_db.update_interview_score(interview_id, round(avg_score, 1),
-                                          len(session['responses']), target_total)
+    # Save to database: this answer only, or everything in one transaction once completed
+    if interview_id:
+        if completed:
+            avg_score = session['score'] / len(session['responses']) if session['responses'] else 0
+            interview_db.finalize_interview(interview_id, round(avg_score, 1),
+                                            len(session['responses']), target_total,
+                                            response_data, session.get('resume_analysis'))
+        else:
+            interview_db.add_response(interview_id, current_q, response_data)
 
     # Pre-generate the next question (so the next page load has it)
     if not completed:
@@ -718,23 +733,12 @@ def admin():
 @app.route('/admin/interview/<int:interview_id>')
 def admin_interview_detail(interview_id):
     """View detailed interview results"""
-    interview = interview_db.get_interview(interview_id)
+    interview = interview_db.get_interview_full(interview_id)
     if not interview:
         return "Interview not found", 404
 
-    # Parse JSON data - handle None values
-    responses_data = interview.get('responses') or '[]'
-    resume_analysis_data = interview.get('resume_analysis') or '{}'
-
-    try:
-        responses = json.loads(responses_data)
-    except (json.JSONDecodeError, TypeError):
-        responses = []
-
-    try:
-        resume_analysis = json.loads(resume_analysis_data)
-    except (json.JSONDecodeError, TypeError):
-        resume_analysis = {}
+    responses = interview['responses']
+    resume_analysis = interview['resume_analysis']
 
     return render_template('admin_interview_detail.html',
                          interview=interview,
@@ -801,7 +805,7 @@ def analyze_physical():
         if 'physical_analysis' not in session:
             session['physical_analysis'] = {}
         
-        session['physical_analysis'][f'question_{current_q}'] = physical_analysis
+        session['physical_analysis'][str(current_q)] = physical_analysis
         
         return jsonify({
             'success': True,
@@ -836,8 +840,11 @@ def update_physical_analysis():
         if 'physical_analysis' not in session:
             session['physical_analysis'] = {}
         
-        if f'question_{current_q}' not in session['physical_analysis']:
-            session['physical_analysis'][f'question_{current_q}'] = {
+        # Keyed by question index; the cookie session stores JSON so keys are strings
+        physical_store = session['physical_analysis']
+        q_key = str(current_q)
+        if q_key not in physical_store:
+            physical_store[q_key] = {
                 'confidence': 0.0,
                 'voice_quality': 0.0,
                 'body_language': 0.0,
@@ -851,12 +858,16 @@ def update_physical_analysis():
                 }
             }
         
-        current_data = session['physical_analysis'][f'question_{current_q}']
+        current_data = physical_store[q_key]
         details = current_data['details']
         
+        # Dispatch frame and audio analysis to the shared pool so they run concurrently
+        frame_future = physical_analyzer.submit_video_frame(video_frame) if video_frame else None
+        audio_future = physical_analyzer.submit_audio(audio_segment) if audio_segment else None
+        
         # Analyze video frame if provided
-        if video_frame:
-            frame_analysis = physical_analyzer.analyze_video_frame(video_frame)
+        if frame_future:
+            frame_analysis = frame_future.result()
             if frame_analysis:
                 details['confidence_scores'].append(frame_analysis.get('confidence', 5.0))
                 details['posture_scores'].append(frame_analysis.get('posture_score', 5.0))
@@ -873,8 +884,8 @@ def update_physical_analysis():
                     )
         
         # Analyze audio segment if provided
-        if audio_segment:
-            audio_analysis = physical_analyzer.analyze_audio(audio_segment)
+        if audio_future:
+            audio_analysis = audio_future.result()
             if audio_analysis:
                 details['voice_scores'].append(audio_analysis.get('voice_score', 5.0))
                 details['audio_segment_count'] += 1
@@ -915,14 +926,16 @@ def results():
     if 'interview_id' not in session:
         return redirect(url_for('index'))
     
+    responses = session['responses']
+    num_responses = len(responses)
     total_score = session['score']
-    max_possible = len(session['responses']) * 10
+    max_possible = num_responses * 10
     percentage = (total_score / max_possible * 100) if max_possible > 0 else 0
     candidate_name = session.get('candidate_name', 'Anonymous')
     
-    # Generate overall feedback
+    # Generate overall feedback (cached by AIInterviewer while the answers are unchanged)
     overall_feedback = ai_interviewer.generate_overall_feedback(
-        session['responses'], session.get('resume_analysis', {})
+        responses, session.get('resume_analysis', {})
     )
     
     # Store prediction scores with candidate name
@@ -934,8 +947,8 @@ def results():
         'total_score': total_score,
         'percentage': percentage,
         'max_possible': max_possible,
-        'total_questions': len(session['responses']),
-        'responses': session['responses'],
+        'total_questions': num_responses,
+        'responses': responses,
         'overall_feedback': overall_feedback,
         'start_time': session.get('start_time'),
         'end_time': datetime.now().isoformat(),
@@ -956,7 +969,7 @@ def results():
                          candidate_name=candidate_name,
                          score=total_score,
                          percentage=percentage,
-                         responses=session['responses'],
+                         responses=responses,
                          overall_feedback=overall_feedback,
                          resume_analysis=session.get('resume_analysis'))
 
@@ -5,6 +5,11 @@ class Config:
     UPLOAD_FOLDER = 'uploads'
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file size
     
+    # Response compression (Flask-Compress) for JSON/HTML-heavy endpoints
+    COMPRESS_MIMETYPES = ['application/json', 'text/html', 'text/css', 'application/javascript']
+    COMPRESS_LEVEL = 6
+    COMPRESS_MIN_SIZE = 500  # Only gzip responses larger than 500 bytes
+    
     # API Keys for Question Generation (Multiple providers for reliability)
     # Use environment variables: ROUTER_API_KEY, DEEPSEEK_API_KEY, HUGGINGFACE_API_KEY
     ROUTER_API_KEY = os.getenv('ROUTER_API_KEY', '')
@@ -32,6 +37,7 @@ class Config:
     CONFIDENCE_WEIGHT = 0.5  # Confidence is key
     VOICE_WEIGHT = 0.3
     BODY_LANGUAGE_WEIGHT = 0.2
+    PHYSICAL_ANALYSIS_WORKERS = 16  # Shared pool size for concurrent (I/O-bound) Hugging Face calls
     
     # Interview settings
     MIN_QUESTIONS = 5
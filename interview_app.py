@@ -9,13 +9,28 @@ from models.question_generator import QuestionGenerator
 from models.physical_analyzer import PhysicalAnalyzer
 from models.resume_analyzer import ResumeAnalyzer
 from utils.helpers import allowed_file, calculate_score, clean_text
+from utils.constants import CORS_HEADERS
+from utils.json_provider import OrjsonProvider, ORJSON_SUPPORT
 import secrets
 import ssl
+try:
+    from flask_compress import Compress
+    COMPRESS_SUPPORT = True
+except ImportError:
+    COMPRESS_SUPPORT = False
 from functools import wraps
 
 app = Flask(__name__)
 app.config.from_object(Config)
 
+# Gzip large JSON/HTML responses (e.g. /analyze_physical, /results)
+if COMPRESS_SUPPORT:
+    Compress(app)
+
+# Serialize jsonify responses (e.g. per-frame /update_physical_analysis) with orjson
+if ORJSON_SUPPORT:
+    app.json = OrjsonProvider(app)
+
 # Admin credentials (simple for now as requested)
 ADMIN_PASSWORD = "123456"
 
@@ -40,9 +55,7 @@ resume_analyzer = ResumeAnalyzer()
 # Add CORS headers for microphone access
 @app.after_request
 def after_request(response):
-    response.headers.add('Access-Control-Allow-Origin', '*')
-    response.headers.add('Access-Control-Allow-Headers', 'Content-Type,Authorization')
-    response.headers.add('Access-Control-Allow-Methods', 'GET,PUT,POST,DELETE,OPTIONS')
+    response.headers.update(CORS_HEADERS)
     return response
 
 @app.route('/')
@@ -82,18 +95,10 @@ def analyze_resume():
         if file.filename == '' or not allowed_file(file.filename):
             return redirect(request.url)
         
-        # Save file temporarily
-        filename = secrets.token_hex(8) + "_" + file.filename
-        filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(filepath)
-        
         try:
-            # Perform analysis
+            # Perform analysis straight from the upload stream (spooled by Werkzeug)
             print(f"📄 Analyzing resume: {file.filename}")
-            analysis = resume_analyzer.analyze_resume_file(filepath)
-            
-            # Clean up file
-            # os.remove(filepath)
+            analysis = resume_analyzer.analyze_resume_stream(file.stream, file.filename)
         except Exception as e:
             print(f"Error analyzing resume: {e}")
             return render_template('error.html', 
@@ -420,8 +425,10 @@ def submit_answer():
     job_role = session['job_role']
     resume_analysis = session.get('resume_analysis', {})
     
-    # Get physical analysis data if available
-    physical_data = session.get('physical_analysis', {}).get(f'question_{current_q}', {})
+    # Get physical analysis data if available (keyed by question index)
+    physical_store = session.get('physical_analysis', {})
+    q_key = str(current_q)
+    physical_data = physical_store.get(q_key, {})
     
     # Analyze the answer
     score, feedback, detailed_analysis = ai_interviewer.analyze_answer(
@@ -468,8 +475,7 @@ def submit_answer():
     session['responses'].append(response_data)
     
     # Clear physical analysis for next question
-    if f'question_{current_q}' in session.get('physical_analysis', {}):
-        session['physical_analysis'].pop(f'question_{current_q}', None)
+    physical_store.pop(q_key, None)
     
     session['score'] += score
     session['current_question'] += 1
@@ -563,7 +569,7 @@ def analyze_physical():
         if 'physical_analysis' not in session:
             session['physical_analysis'] = {}
         
-        session['physical_analysis'][f'question_{current_q}'] = physical_analysis
+        session['physical_analysis'][str(current_q)] = physical_analysis
         
         return jsonify({
             'success': True,
@@ -598,8 +604,11 @@ def update_physical_analysis():
         if 'physical_analysis' not in session:
             session['physical_analysis'] = {}
         
-        if f'question_{current_q}' not in session['physical_analysis']:
-            session['physical_analysis'][f'question_{current_q}'] = {
+        # Keyed by question index; the cookie session stores JSON so keys are strings
+        physical_store = session['physical_analysis']
+        q_key = str(current_q)
+        if q_key not in physical_store:
+            physical_store[q_key] = {
                 'confidence': 0.0,
                 'voice_quality': 0.0,
                 'body_language': 0.0,
@@ -619,12 +628,16 @@ def update_physical_analysis():
                 }
             }
         
-        current_data = session['physical_analysis'][f'question_{current_q}']
+        current_data = physical_store[q_key]
         details = current_data['details']
         
+        # Dispatch frame and audio analysis to the shared pool so they run concurrently
+        frame_future = physical_analyzer.submit_video_frame(video_frame) if video_frame else None
+        audio_future = physical_analyzer.submit_audio(audio_segment) if audio_segment else None
+        
         # Analyze video frame if provided
-        if video_frame:
-            frame_analysis = physical_analyzer.analyze_video_frame(video_frame)
+        if frame_future:
+            frame_analysis = frame_future.result()
             if frame_analysis:
                 details['confidence_scores'].append(frame_analysis.get('confidence', 5.0))
                 details['posture_scores'].append(frame_analysis.get('posture_score', 5.0))
@@ -664,8 +677,8 @@ def update_physical_analysis():
                 current_data['violations'] = violations
         
         # Analyze audio segment if provided
-        if audio_segment:
-            audio_analysis = physical_analyzer.analyze_audio(audio_segment)
+        if audio_future:
+            audio_analysis = audio_future.result()
             if audio_analysis:
                 details['voice_scores'].append(audio_analysis.get('voice_score', 5.0))
                 details['audio_segment_count'] += 1
@@ -726,13 +739,14 @@ def results():
     if 'interview_id' not in session:
         return redirect(url_for('index'))
     
+    responses = session['responses']
+    num_responses = len(responses)
     total_score = session['score']
-    max_possible = len(session['responses']) * 10
+    max_possible = num_responses * 10
     percentage = (total_score / max_possible * 100) if max_possible > 0 else 0
     candidate_name = session.get('candidate_name', 'Candidate')
     
     # Aggregate physical analysis data from responses
-    responses_history = session.get('responses', [])
     avg_confidence = 0
     avg_voice = 0
     avg_posture = 0
@@ -740,7 +754,7 @@ def results():
     all_emotions = []
     
     physical_count = 0
-    for resp in responses_history:
+    for resp in responses:
         pa = resp.get('physical_analysis')
         if pa:
             conf = pa.get('confidence', 0)
@@ -780,9 +794,9 @@ def results():
         # Sort by impact
         emotion_profile = dict(sorted(emotion_profile.items(), key=lambda x: x[1], reverse=True))
 
-    # Generate overall feedback
+    # Generate overall feedback (cached by AIInterviewer while the answers are unchanged)
     overall_feedback = ai_interviewer.generate_overall_feedback(
-        session['responses'], session.get('resume_analysis', {})
+        responses, session.get('resume_analysis', {})
     )
     
     # Store prediction scores with candidate name
@@ -793,8 +807,8 @@ def results():
         'total_score': total_score,
         'percentage': percentage,
         'max_possible': max_possible,
-        'total_questions': len(session['responses']),
-        'responses': session['responses'],
+        'total_questions': num_responses,
+        'responses': responses,
         'overall_feedback': overall_feedback,
         'start_time': session.get('start_time'),
         'end_time': datetime.now().isoformat(),
@@ -820,7 +834,7 @@ def results():
     
     return render_template('results.html',
                          candidate_name=candidate_name,
-                         responses=session.get('responses', []))
+                         responses=responses)
 
 @app.route('/admin')
 @require_admin
@@ -1,5 +1,8 @@
+import hashlib
 import json
 import os
+import threading
+from collections import OrderedDict
 import nltk
 import requests
 from nltk.tokenize import word_tokenize, sent_tokenize
@@ -11,6 +14,9 @@ try:
 except LookupError:
     nltk.download('punkt')
 
+# Overall feedback kept per distinct set of answers (least recently used evicted first)
+FEEDBACK_CACHE_SIZE = 256
+
 class AIInterviewer:
     def __init__(self):
         self.questions_file = 'data/questions/interview_questions.json'
@@ -25,6 +31,9 @@ class AIInterviewer:
         self.deepseek_api_key = Config.DEEPSEEK_API_KEY
         self.router_api_url = Config.ROUTER_API_URL
         self.deepseek_api_url = Config.DEEPSEEK_API_URL
+        
+        self._feedback_cache = OrderedDict()
+        self._feedback_lock = threading.Lock()
     
     def _load_questions(self):
         try:
@@ -471,6 +480,22 @@ Score the answer based on:
             return None, None, None
     
     def generate_overall_feedback(self, responses, resume_analysis):
+        """Overall feedback, cached by the content of the answers so results page refreshes reuse it"""
+        key = hashlib.sha1(json.dumps([responses, resume_analysis], sort_keys=True, default=str)
+                           .encode('utf-8')).hexdigest()
+        with self._feedback_lock:
+            if key in self._feedback_cache:
+                self._feedback_cache.move_to_end(key)
+                return self._feedback_cache[key]
+        
+        feedback = self._generate_overall_feedback(responses, resume_analysis)
+        with self._feedback_lock:
+            self._feedback_cache[key] = feedback
+            if len(self._feedback_cache) > FEEDBACK_CACHE_SIZE:
+                self._feedback_cache.popitem(last=False)
+        return feedback
+    
+    def _generate_overall_feedback(self, responses, resume_analysis):
         if not responses:
             return "No responses to evaluate."
         
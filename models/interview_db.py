@@ -1,21 +1,209 @@
+try:
+    import orjson
+    ORJSON_SUPPORT = True
+except ImportError:
+    ORJSON_SUPPORT = False
 import sqlite3
 import json
-from datetime import datetime
+import copy
+import time
+import threading
+import weakref
+from datetime import datetime, timezone
 from contextlib import contextmanager
 
+# Prepared statements kept per connection (sqlite3 default is 128)
+STATEMENT_CACHE_SIZE = 256
+
+# Idle connections kept open between calls. The threaded dev server runs each
+# request on a new thread, so connections are pooled rather than per-thread.
+POOL_SIZE = 8
+
+# Applied to every new connection: WAL lets dashboard reads run alongside writes,
+# synchronous=NORMAL needs one fsync per commit instead of two, 64MB page cache
+CONNECTION_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA cache_size=-64000',
+    'PRAGMA mmap_size=268435456',
+)
+
+# Seconds a dashboard aggregate may be served from memory without a write in between
+STATS_CACHE_TTL = 30
+
+# Columns save_session() may update, and those stored as JSON text.
+# Responses live in their own table; use add_response/save_responses_bulk.
+SESSION_COLUMNS = frozenset({
+    'candidate_name', 'job_role', 'total_questions', 'completed_questions',
+    'overall_score', 'status', 'start_time', 'end_time', 'resume_analysis'
+})
+JSON_COLUMNS = frozenset({'resume_analysis'})
+
+# Columns needed by list views; skips the large responses/resume_analysis JSON
+SUMMARY_COLUMNS = '''
+    id, candidate_name, job_role, overall_score, status, start_time, end_time,
+    created_at, completed_questions, total_questions
+'''
+
+# status is stored as a small INTEGER; rows are decoded back to these names on read
+STATUS_IN_PROGRESS, STATUS_COMPLETED, STATUS_FAILED = 0, 1, 2
+STATUS_CODES = {'in_progress': STATUS_IN_PROGRESS, 'completed': STATUS_COMPLETED, 'failed': STATUS_FAILED}
+STATUS_NAMES = {code: name for name, code in STATUS_CODES.items()}
+
+# Stored as INTEGER unix epoch seconds; rows are decoded back to the strings these columns
+# held as TEXT: start/end from datetime.now().isoformat() (local time), created_at from
+# CURRENT_TIMESTAMP (UTC, 'YYYY-MM-DD HH:MM:SS')
+TIMESTAMP_COLUMNS = ('start_time', 'end_time', 'created_at')
+
+# INSERT ... RETURNING needs SQLite 3.35+; older builds fall back to cursor.lastrowid
+RETURNING_SUPPORT = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+INSERT_INTERVIEW_SQL = '''
+    INSERT INTO interviews (candidate_name, job_role, start_time, status)
+    VALUES (?, ?, ?, ?)
+''' + ('RETURNING id' if RETURNING_SUPPORT else '')
+
+INSERT_RESPONSE_SQL = '''
+    INSERT OR REPLACE INTO responses (interview_id, q_idx, question, answer, score, details)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+
+def dump_json(obj):
+    """Encode a JSON column value, using orjson's C encoder when available"""
+    if ORJSON_SUPPORT:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj)
+
+def _response_row(interview_id, q_idx, response):
+    return (interview_id, q_idx, response.get('question'), response.get('answer'),
+            response.get('score'), dump_json(response))
+
+def to_epoch(value):
+    """Encode a timestamp column value (datetime, ISO-8601 string or epoch) as epoch seconds"""
+    if value is None or isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return int(value.timestamp())
+
+def _decode_row(row):
+    """Turn an interviews row into a dict with status names and the original timestamp strings"""
+    interview = dict(row)
+    if 'status' in interview:
+        interview['status'] = STATUS_NAMES.get(interview['status'], interview['status'])
+    for column in TIMESTAMP_COLUMNS:
+        if interview.get(column) is None:
+            continue
+        if column == 'created_at':
+            interview[column] = datetime.fromtimestamp(interview[column], timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+        else:
+            interview[column] = datetime.fromtimestamp(interview[column]).isoformat()
+    return interview
+
+def _close_connections(pool, lock):
+    """Close idle pooled connections (also run by weakref.finalize, so it must not use self)"""
+    with lock:
+        for conn in pool:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        pool.clear()
+
+def load_json(text, default=None):
+    """Decode a JSON column value, returning default for NULL or malformed data"""
+    if not text:
+        return default
+    try:
+        return orjson.loads(text) if ORJSON_SUPPORT else json.loads(text)
+    except (ValueError, TypeError):
+        return default
+
 class InterviewDatabase:
     def __init__(self, db_path='interviews.db'):
         self.db_path = db_path
+        # Pooled long-lived connections keep their statement and page caches warm
+        self._pool = []
+        self._pool_lock = threading.Lock()
+        self._local = threading.local()  # connection checked out by this thread, if any
+        # Dashboard aggregates: key -> (computed_at, value); cleared on writes
+        self._stats_cache = {}
+        self._stats_generation = 0
+        self._stats_lock = threading.Lock()
+        # Closes the pool at exit or when the instance is collected, without keeping it alive
+        weakref.finalize(self, _close_connections, self._pool, self._pool_lock)
         self.init_db()
 
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                               cached_statements=STATEMENT_CACHE_SIZE)
+        conn.row_factory = sqlite3.Row
+        self._apply_pragmas(conn)
+        return conn
+
+    def _apply_pragmas(self, conn):
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+
     @contextmanager
     def get_connection(self):
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        held = getattr(self._local, 'conn', None)
+        if held is not None:
+            # Nested use on this thread shares the connection it already checked out
+            yield held
+            return
+
+        with self._pool_lock:
+            conn = self._pool.pop() if self._pool else None
+        if conn is None:
+            conn = self._connect()
+        self._local.conn = conn
         try:
             yield conn
+        except Exception:
+            # Don't leave a half-finished transaction open on the reused connection
+            conn.rollback()
+            raise
         finally:
-            conn.close()
+            self._local.conn = None
+            self._release(conn)
+
+    def _release(self, conn):
+        if conn.in_transaction:
+            conn.rollback()
+        with self._pool_lock:
+            if len(self._pool) < POOL_SIZE:
+                self._pool.append(conn)
+                return
+        conn.close()
+
+    def close(self):
+        """Close all idle pooled connections"""
+        _close_connections(self._pool, self._pool_lock)
+
+    def _cached_stats(self, key, compute):
+        """Return a dashboard aggregate from cache, recomputing it when stale or invalidated"""
+        with self._stats_lock:
+            entry = self._stats_cache.get(key)
+            if entry and time.monotonic() - entry[0] < STATS_CACHE_TTL:
+                return copy.deepcopy(entry[1])
+            generation = self._stats_generation
+
+        value = compute()
+        with self._stats_lock:
+            # Skip storing if a write invalidated the cache while we were computing
+            if generation == self._stats_generation:
+                self._stats_cache[key] = (time.monotonic(), value)
+        return copy.deepcopy(value)
+
+    def _invalidate_stats(self):
+        with self._stats_lock:
+            self._stats_generation += 1
+            self._stats_cache.clear()
 
     def init_db(self):
         with self.get_connection() as conn:
@@ -27,24 +215,83 @@ class InterviewDatabase:
                     total_questions INTEGER DEFAULT 0,
                     completed_questions INTEGER DEFAULT 0,
                     overall_score REAL DEFAULT 0.0,
-                    status TEXT DEFAULT 'in_progress',
-                    start_time TEXT,
-                    end_time TEXT,
-                    responses TEXT,  -- JSON string of responses
+                    status INTEGER DEFAULT 0,  -- STATUS_CODES
+                    start_time INTEGER,  -- unix epoch seconds
+                    end_time INTEGER,
+                    responses TEXT,  -- JSON string of responses (legacy rows; see responses table)
                     resume_analysis TEXT,  -- JSON string of resume analysis
-                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+                    created_at INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER))
+                )
+            ''')
+            self._migrate_text_columns(conn)
+            # One row per answered question, so each answer is a single INSERT
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS responses (
+                    interview_id INTEGER NOT NULL,
+                    q_idx INTEGER NOT NULL,
+                    question TEXT,
+                    answer TEXT,
+                    score REAL,
+                    details TEXT,  -- JSON string of the full response (feedback, analysis)
+                    PRIMARY KEY (interview_id, q_idx),
+                    FOREIGN KEY (interview_id) REFERENCES interviews(id)
                 )
             ''')
+            # Dashboard queries sort by created_at and filter/group by status and job_role
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_interviews_created_at ON interviews(created_at DESC)')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_interviews_status ON interviews(status)')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_interviews_role_status ON interviews(job_role, status)')
             conn.commit()
 
+    def _migrate_text_columns(self, conn):
+        """Rewrite databases created with TEXT status/timestamps to the INTEGER schema"""
+        columns = {row['name']: row['type'] for row in conn.execute('PRAGMA table_info(interviews)')}
+        if columns.get('status', '').upper() != 'TEXT':
+            return
+
+        status_case = ' '.join(f"WHEN '{name}' THEN {code}" for name, code in STATUS_CODES.items())
+        # ISO strings from datetime.isoformat() are local time; CURRENT_TIMESTAMP defaults are UTC
+        conn.execute('BEGIN')  # one transaction, committed by init_db()
+        conn.execute('DROP INDEX IF EXISTS idx_interviews_created_at')
+        conn.execute('DROP INDEX IF EXISTS idx_interviews_status')
+        conn.execute('DROP INDEX IF EXISTS idx_interviews_role_status')
+        conn.execute('ALTER TABLE interviews RENAME TO interviews_text')
+        conn.execute('''
+            CREATE TABLE interviews (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                candidate_name TEXT NOT NULL,
+                job_role TEXT DEFAULT 'software_engineer',
+                total_questions INTEGER DEFAULT 0,
+                completed_questions INTEGER DEFAULT 0,
+                overall_score REAL DEFAULT 0.0,
+                status INTEGER DEFAULT 0,
+                start_time INTEGER,
+                end_time INTEGER,
+                responses TEXT,
+                resume_analysis TEXT,
+                created_at INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER))
+            )
+        ''')
+        conn.execute(f'''
+            INSERT INTO interviews
+            SELECT id, candidate_name, job_role, total_questions, completed_questions,
+                   overall_score,
+                   CASE status {status_case} ELSE {STATUS_IN_PROGRESS} END,
+                   CAST(strftime('%s', start_time, 'utc') AS INTEGER),
+                   CAST(strftime('%s', end_time, 'utc') AS INTEGER),
+                   responses, resume_analysis,
+                   CAST(strftime('%s', created_at) AS INTEGER)
+            FROM interviews_text
+        ''')
+        conn.execute('DROP TABLE interviews_text')
+
     def create_interview(self, candidate_name, job_role='software_engineer'):
         with self.get_connection() as conn:
-            cursor = conn.execute('''
-                INSERT INTO interviews (candidate_name, job_role, start_time, status)
-                VALUES (?, ?, ?, ?)
-            ''', (candidate_name, job_role, datetime.now().isoformat(), 'in_progress'))
-            interview_id = cursor.lastrowid
+            cursor = conn.execute(INSERT_INTERVIEW_SQL,
+                                  (candidate_name, job_role, int(time.time()), STATUS_IN_PROGRESS))
+            interview_id = cursor.fetchone()[0] if RETURNING_SUPPORT else cursor.lastrowid
             conn.commit()
+            self._invalidate_stats()
             return interview_id
 
     def update_interview_score(self, interview_id, score, completed_questions, total_questions):
@@ -55,103 +302,180 @@ class InterviewDatabase:
                     end_time = ?, status = ?
                 WHERE id = ?
             ''', (score, completed_questions, total_questions,
-                  datetime.now().isoformat(), 'completed', interview_id))
+                  int(time.time()), STATUS_COMPLETED, interview_id))
             conn.commit()
+            self._invalidate_stats()
 
-    def save_responses(self, interview_id, responses):
+    def finalize_interview(self, interview_id, score, completed_questions, total_questions,
+                           final_response=None, resume_analysis=None):
+        """Write the last answer, final score and resume analysis in a single transaction/commit
+
+        Earlier answers are already stored by add_response, so only final_response is inserted.
+        """
         with self.get_connection() as conn:
+            if final_response is not None:
+                q_idx = final_response.get('question_index', completed_questions - 1)
+                conn.execute(INSERT_RESPONSE_SQL, _response_row(interview_id, q_idx, final_response))
             conn.execute('''
                 UPDATE interviews
-                SET responses = ?
+                SET overall_score = ?, completed_questions = ?, total_questions = ?,
+                    end_time = ?, status = ?,
+                    resume_analysis = COALESCE(?, resume_analysis)
                 WHERE id = ?
-            ''', (json.dumps(responses), interview_id))
+            ''', (score, completed_questions, total_questions,
+                  int(time.time()), STATUS_COMPLETED,
+                  dump_json(resume_analysis) if resume_analysis is not None else None,
+                  interview_id))
+            conn.commit()
+            self._invalidate_stats()
+
+    def save_session(self, interview_id, **fields):
+        """Update any subset of interview columns in one statement"""
+        unknown = set(fields) - SESSION_COLUMNS
+        if unknown:
+            raise ValueError(f"Unknown interview columns: {', '.join(sorted(unknown))}")
+        if not fields:
+            return
+
+        for column in JSON_COLUMNS & fields.keys():
+            fields[column] = dump_json(fields[column])
+        for column in set(TIMESTAMP_COLUMNS) & fields.keys():
+            fields[column] = to_epoch(fields[column])
+        if 'status' in fields:
+            fields['status'] = STATUS_CODES.get(fields['status'], fields['status'])
+
+        # Column names come from the SESSION_COLUMNS whitelist; values stay parameterized
+        assignments = ', '.join(f'{column} = ?' for column in fields)
+        with self.get_connection() as conn:
+            conn.execute(f'UPDATE interviews SET {assignments} WHERE id = ?',
+                         (*fields.values(), interview_id))
+            conn.commit()
+            self._invalidate_stats()
+
+    def add_response(self, interview_id, q_idx, response):
+        """Store one answered question (re-answering the same index replaces it)"""
+        with self.get_connection() as conn:
+            conn.execute(INSERT_RESPONSE_SQL, _response_row(interview_id, q_idx, response))
+            conn.commit()
+
+    def save_responses_bulk(self, interview_id, responses):
+        """Replace all stored responses for an interview in one transaction"""
+        with self.get_connection() as conn:
+            self._replace_responses(conn, interview_id, responses)
             conn.commit()
 
+    def _replace_responses(self, conn, interview_id, responses):
+        conn.execute('DELETE FROM responses WHERE interview_id = ?', (interview_id,))
+        conn.executemany(INSERT_RESPONSE_SQL, [
+            _response_row(interview_id, response.get('question_index', i), response)
+            for i, response in enumerate(responses)
+        ])
+
+    def get_responses(self, interview_id):
+        """Return stored responses in question order"""
+        with self.get_connection() as conn:
+            rows = conn.execute('''
+                SELECT details FROM responses
+                WHERE interview_id = ?
+                ORDER BY q_idx
+            ''', (interview_id,)).fetchall()
+            return [load_json(row[0], {}) for row in rows]
+
     def save_resume_analysis(self, interview_id, resume_analysis):
         with self.get_connection() as conn:
             conn.execute('''
                 UPDATE interviews
                 SET resume_analysis = ?
                 WHERE id = ?
-            ''', (json.dumps(resume_analysis), interview_id))
+            ''', (dump_json(resume_analysis), interview_id))
             conn.commit()
 
     def get_interview(self, interview_id):
         with self.get_connection() as conn:
             row = conn.execute('SELECT * FROM interviews WHERE id = ?', (interview_id,)).fetchone()
             if row:
-                return dict(row)
+                return _decode_row(row)
             return None
 
+    def get_interview_full(self, interview_id):
+        """Get an interview with parsed responses and resume analysis, for detail views"""
+        interview = self.get_interview(interview_id)
+        if not interview:
+            return None
+        # Fall back to the legacy JSON column for interviews saved before the responses table
+        interview['responses'] = (self.get_responses(interview_id)
+                                  or load_json(interview.get('responses'), []))
+        interview['resume_analysis'] = load_json(interview.get('resume_analysis'), {})
+        return interview
+
     def get_all_interviews(self, limit=100, offset=0):
         with self.get_connection() as conn:
-            rows = conn.execute('''
-                SELECT * FROM interviews
+            rows = conn.execute(f'''
+                SELECT {SUMMARY_COLUMNS} FROM interviews
                 ORDER BY created_at DESC
                 LIMIT ? OFFSET ?
             ''', (limit, offset)).fetchall()
-            return [dict(row) for row in rows]
+            return [_decode_row(row) for row in rows]
 
     def get_interview_stats(self):
+        return self._cached_stats('interview_stats', self._query_interview_stats)
+
+    def _query_interview_stats(self):
         with self.get_connection() as conn:
-            stats = conn.execute('''
+            stats = conn.execute(f'''
                 SELECT
                     COUNT(*) as total_interviews,
                     AVG(overall_score) as avg_score,
-                    COUNT(CASE WHEN status = 'completed' THEN 1 END) as completed_interviews,
-                    COUNT(CASE WHEN status = 'in_progress' THEN 1 END) as in_progress_interviews,
-                    COUNT(CASE WHEN status = 'failed' THEN 1 END) as failed_interviews,
+                    COUNT(CASE WHEN status = {STATUS_COMPLETED} THEN 1 END) as completed_interviews,
+                    COUNT(CASE WHEN status = {STATUS_IN_PROGRESS} THEN 1 END) as in_progress_interviews,
+                    COUNT(CASE WHEN status = {STATUS_FAILED} THEN 1 END) as failed_interviews,
                     MAX(overall_score) as highest_score,
                     MIN(overall_score) as lowest_score,
-                    AVG(CASE WHEN status = 'completed' THEN overall_score END) as avg_completed_score
+                    AVG(CASE WHEN status = {STATUS_COMPLETED} THEN overall_score END) as avg_completed_score
                 FROM interviews
             ''').fetchone()
             return dict(stats)
 
     def get_score_distribution(self):
         """Get score distribution for charting"""
+        return self._cached_stats('score_distribution', self._query_score_distribution)
+
+    def _query_score_distribution(self):
         with self.get_connection() as conn:
-            scores = conn.execute('''
-                SELECT overall_score
+            row = conn.execute(f'''
+                SELECT
+                    COUNT(CASE WHEN overall_score < 2 THEN 1 END),
+                    COUNT(CASE WHEN overall_score >= 2 AND overall_score < 4 THEN 1 END),
+                    COUNT(CASE WHEN overall_score >= 4 AND overall_score < 6 THEN 1 END),
+                    COUNT(CASE WHEN overall_score >= 6 AND overall_score < 8 THEN 1 END),
+                    COUNT(CASE WHEN overall_score >= 8 THEN 1 END)
                 FROM interviews
-                WHERE overall_score IS NOT NULL AND status = 'completed'
-            ''').fetchall()
-
-            distribution = {'0-2': 0, '2-4': 0, '4-6': 0, '6-8': 0, '8-10': 0}
-            for row in scores:
-                score = row[0]
-                if score < 2:
-                    distribution['0-2'] += 1
-                elif score < 4:
-                    distribution['2-4'] += 1
-                elif score < 6:
-                    distribution['4-6'] += 1
-                elif score < 8:
-                    distribution['6-8'] += 1
-                else:
-                    distribution['8-10'] += 1
-
-            return distribution
+                WHERE overall_score IS NOT NULL AND status = {STATUS_COMPLETED}
+            ''').fetchone()
+            return dict(zip(('0-2', '2-4', '4-6', '6-8', '8-10'), row))
 
     def get_recent_interviews(self, limit=10):
         """Get recent interviews for dashboard"""
         with self.get_connection() as conn:
-            interviews = conn.execute('''
-                SELECT * FROM interviews
+            interviews = conn.execute(f'''
+                SELECT {SUMMARY_COLUMNS} FROM interviews
                 ORDER BY created_at DESC
                 LIMIT ?
             ''', (limit,)).fetchall()
-            return [dict(row) for row in interviews]
+            return [_decode_row(row) for row in interviews]
 
     def get_job_role_stats(self):
         """Get statistics by job role"""
+        return self._cached_stats('job_role_stats', self._query_job_role_stats)
+
+    def _query_job_role_stats(self):
         with self.get_connection() as conn:
-            stats = conn.execute('''
+            stats = conn.execute(f'''
                 SELECT
                     job_role,
                     COUNT(*) as total,
                     AVG(overall_score) as avg_score,
-                    COUNT(CASE WHEN status = 'completed' THEN 1 END) as completed
+                    COUNT(CASE WHEN status = {STATUS_COMPLETED} THEN 1 END) as completed
                 FROM interviews
                 GROUP BY job_role
                 ORDER BY total DESC
@@ -160,5 +484,7 @@ class InterviewDatabase:
 
     def delete_interview(self, interview_id):
         with self.get_connection() as conn:
+            conn.execute('DELETE FROM responses WHERE interview_id = ?', (interview_id,))
             conn.execute('DELETE FROM interviews WHERE id = ?', (interview_id,))
-            conn.commit()
\ No newline at end of file
+            conn.commit()
+            self._invalidate_stats()
\ No newline at end of file
@@ -3,11 +3,17 @@ Physical Actions Analyzer
 Analyzes confidence, voice, body language, and actions during interview using Hugging Face API
 """
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import base64
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from config import Config
 
+# (confidence, voice, body language) weights for the overall physical score
+PHYSICAL_SCORE_WEIGHTS = np.array([Config.CONFIDENCE_WEIGHT, Config.VOICE_WEIGHT, Config.BODY_LANGUAGE_WEIGHT])
+
 class PhysicalAnalyzer:
     def __init__(self):
         self.api_key = Config.HUGGINGFACE_API_KEY
@@ -19,6 +25,25 @@ class PhysicalAnalyzer:
         self.sentiment_model = Config.SENTIMENT_MODEL
         self.body_pose_model = 'facebook/detr-resnet-50'  # Body pose detection
         
+        # Keep-alive session so frame/audio calls reuse TLS connections to the Inference API
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32,
+                              max_retries=Retry(total=2, backoff_factor=0.2))
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Bounded pool shared by all requests so concurrent frames don't spawn unbounded API calls
+        self.executor = ThreadPoolExecutor(
+            max_workers=Config.PHYSICAL_ANALYSIS_WORKERS,
+            thread_name_prefix='physical-analysis'
+        )
+        # Separate pool for the per-frame model calls: analyze_video_frame itself runs on
+        # self.executor, so waiting on that same pool from inside it could deadlock
+        self.model_executor = ThreadPoolExecutor(
+            max_workers=Config.PHYSICAL_ANALYSIS_WORKERS,
+            thread_name_prefix='physical-model'
+        )
+        
         # Store analysis results
         self.current_analysis = {
             'confidence': 0.0,
@@ -48,11 +73,13 @@ class PhysicalAnalyzer:
                 # For now, assume string is base64
                 image_data = str(frame_data)
             
-            # Analyze face emotions
-            emotion_scores = self._analyze_face_emotion(image_data, headers)
+            # Build the data URI payload once; both models receive the same image
+            payload = self._image_payload(image_data)
             
-            # Analyze objects (person counting and phone detection)
-            object_results = self._analyze_objects(image_data, headers)
+            # Analyze objects (person counting and phone detection) alongside face emotions
+            objects_future = self.model_executor.submit(self._analyze_objects, payload, headers)
+            emotion_scores = self._analyze_face_emotion(payload, headers)
+            object_results = objects_future.result()
             
             # Calculate confidence based on facial expressions
             confidence = self._calculate_confidence(emotion_scores)
@@ -69,13 +96,24 @@ class PhysicalAnalyzer:
             print(f"Error analyzing video frame: {e}")
             return None
 
-    def _analyze_face_emotion(self, image_data, headers):
+    def submit_video_frame(self, frame_data):
+        """Queue a video frame on the shared pool; returns a Future of analyze_video_frame"""
+        return self.executor.submit(self.analyze_video_frame, frame_data)
+
+    def submit_audio(self, audio_data):
+        """Queue an audio segment on the shared pool; returns a Future of analyze_audio"""
+        return self.executor.submit(self.analyze_audio, audio_data)
+
+    def _image_payload(self, image_data):
+        """JSON payload for the image models (base64 frame as a JPEG data URI)"""
+        return {"inputs": f"data:image/jpeg;base64,{image_data}"}
+
+    def _analyze_face_emotion(self, payload, headers):
         """Analyze facial emotions using Hugging Face model"""
         try:
-            payload = {"inputs": f"data:image/jpeg;base64,{image_data}"}
             api_endpoint = f"https://api-inference.huggingface.co/models/{self.face_emotion_model}"
             
-            response = requests.post(api_endpoint, headers=headers, json=payload, timeout=12)
+            response = self.session.post(api_endpoint, headers=headers, json=payload, timeout=12)
             
             if response.status_code == 200:
                 result = response.json()
@@ -89,13 +127,12 @@ class PhysicalAnalyzer:
             print(f"Error in face emotion analysis: {e}")
         return {}
 
-    def _analyze_objects(self, image_data, headers):
+    def _analyze_objects(self, payload, headers):
         """Detect persons and cell phones in the frame"""
         try:
-            payload = {"inputs": f"data:image/jpeg;base64,{image_data}"}
             api_endpoint = f"https://api-inference.huggingface.co/models/{self.body_pose_model}"
             
-            response = requests.post(api_endpoint, headers=headers, json=payload, timeout=12)
+            response = self.session.post(api_endpoint, headers=headers, json=payload, timeout=12)
             
             if response.status_code == 200:
                 result = response.json()
@@ -152,7 +189,7 @@ class PhysicalAnalyzer:
 
     def _analyze_body_posture(self, image_data, headers):
         """Deprecated: use _analyze_objects instead"""
-        res = self._analyze_objects(image_data, headers)
+        res = self._analyze_objects(self._image_payload(image_data), headers)
         return res.get('posture_score', 5.0)
 
     def _calculate_confidence(self, emotion_scores):
@@ -192,7 +229,7 @@ class PhysicalAnalyzer:
             api_endpoint = f"https://api-inference.huggingface.co/models/{self.voice_emotion_model}"
             
             # Send binary data directly for audio models
-            response = requests.post(
+            response = self.session.post(
                 api_endpoint,
                 headers={"Authorization": f"Bearer {self.api_key}"},
                 data=payload,
@@ -247,41 +284,46 @@ class PhysicalAnalyzer:
     def analyze_realtime_data(self, video_frames, audio_segments):
         """Analyze data with weights from Config"""
         try:
-            results = []
-            
-            # Video analysis
-            conf_scores = []
-            posture_scores = []
+            # Video analysis (scores written into preallocated arrays, trimmed to valid frames)
+            conf_scores = np.empty(len(video_frames))
+            posture_scores = np.empty(len(video_frames))
             person_counts = []
             phone_detected_flags = []
             
-            for frame in video_frames:
-                fa = self.analyze_video_frame(frame)
+            # Submit every frame and audio segment up front so the HTTP calls overlap
+            frame_results = self.executor.map(self.analyze_video_frame, video_frames)
+            audio_results = self.executor.map(self.analyze_audio, audio_segments)
+            
+            n_frames = 0
+            for fa in frame_results:
                 if fa:
-                    conf_scores.append(fa.get('confidence', 5.0))
-                    posture_scores.append(fa.get('posture_score', 5.0))
+                    conf_scores[n_frames] = fa.get('confidence', 5.0)
+                    posture_scores[n_frames] = fa.get('posture_score', 5.0)
                     person_counts.append(fa.get('person_count', 1))
                     phone_detected_flags.append(fa.get('phone_detected', False))
+                    n_frames += 1
+            conf_scores = conf_scores[:n_frames]
+            posture_scores = posture_scores[:n_frames]
             
             # Audio analysis
-            voice_scores = []
-            for audio in audio_segments:
-                aa = self.analyze_audio(audio)
+            voice_scores = np.empty(len(audio_segments))
+            n_audio = 0
+            for aa in audio_results:
                 if aa:
-                    voice_scores.append(aa.get('voice_score', 5.0))
+                    voice_scores[n_audio] = aa.get('voice_score', 5.0)
+                    n_audio += 1
+            voice_scores = voice_scores[:n_audio]
             
             # Calculate final results
-            avg_conf = np.mean(conf_scores) if conf_scores else self.current_analysis['confidence']
-            avg_posture = np.mean(posture_scores) if posture_scores else self.current_analysis['body_language']
-            avg_voice = np.mean(voice_scores) if voice_scores else self.current_analysis['voice_quality']
+            avg_conf = conf_scores.mean() if n_frames else self.current_analysis['confidence']
+            avg_posture = posture_scores.mean() if n_frames else self.current_analysis['body_language']
+            avg_voice = voice_scores.mean() if n_audio else self.current_analysis['voice_quality']
             
             max_person_count = max(person_counts) if person_counts else 1
             any_phone_detected = any(phone_detected_flags) if phone_detected_flags else False
             
             # Apply weighted score
-            overall = (avg_conf * Config.CONFIDENCE_WEIGHT + 
-                       avg_voice * Config.VOICE_WEIGHT + 
-                       avg_posture * Config.BODY_LANGUAGE_WEIGHT)
+            overall = np.dot((avg_conf, avg_voice, avg_posture), PHYSICAL_SCORE_WEIGHTS)
             
             # Additional security violations check
             violations = []
@@ -302,9 +344,9 @@ class PhysicalAnalyzer:
                 'phone_detected': any_phone_detected,
                 'violations': violations,
                 'details': {
-                    'confidence_history': conf_scores,
-                    'voice_history': voice_scores,
-                    'posture_history': posture_scores,
+                    'confidence_history': conf_scores.tolist(),
+                    'voice_history': voice_scores.tolist(),
+                    'posture_history': posture_scores.tolist(),
                     'person_counts': person_counts,
                     'phone_detections': phone_detected_flags
                 }
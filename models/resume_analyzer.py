@@ -27,35 +27,39 @@ class ResumeAnalyzer:
         }
     
     def parse_resume(self, file_path):
-        filename = file_path.lower()
+        with open(file_path, 'rb') as f:
+            return self.parse_resume_stream(f, file_path)
+    
+    def parse_resume_stream(self, fileobj, filename):
+        """Parse an open binary file object; filename only selects the format"""
+        filename = filename.lower()
         
         if filename.endswith('.pdf'):
-            return self._parse_pdf(file_path)
+            return self._parse_pdf(fileobj)
         elif filename.endswith('.docx'):
-            return self._parse_docx(file_path)
+            return self._parse_docx(fileobj)
         elif filename.endswith('.txt'):
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return f.read()
+            # Non-UTF-8 bytes become U+FFFD rather than failing the whole analysis
+            return fileobj.read().decode('utf-8', errors='replace')
         else:
             raise ValueError("Unsupported file format")
     
-    def _parse_pdf(self, file_path):
+    def _parse_pdf(self, file):
         if not PDF_SUPPORT:
             return "PDF parsing not available - PyPDF2 not installed"
 
         try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                text = ""
-                for page in pdf_reader.pages:
-                    text += page.extract_text()
-                return text
+            pdf_reader = PyPDF2.PdfReader(file)
+            text = ""
+            for page in pdf_reader.pages:
+                text += page.extract_text()
+            return text
         except Exception as e:
             return f"Error reading PDF: {str(e)}"
     
-    def _parse_docx(self, file_path):
+    def _parse_docx(self, file):
         try:
-            doc = Document(file_path)
+            doc = Document(file)
             text = ""
             for paragraph in doc.paragraphs:
                 text += paragraph.text + "\n"
@@ -67,6 +71,11 @@ class ResumeAnalyzer:
         text = self.parse_resume(file_path)
         return self.analyze_resume_text(text)
     
+    def analyze_resume_stream(self, fileobj, filename):
+        """Analyze an uploaded resume straight from its file object, without a disk round-trip"""
+        text = self.parse_resume_stream(fileobj, filename)
+        return self.analyze_resume_text(text)
+    
     def analyze_resume_text(self, text):
         analysis = {}
         
@@ -4,6 +4,7 @@ import secrets
 from config import Config
 from models.resume_analyzer import ResumeAnalyzer
 from utils.helpers import allowed_file
+from utils.constants import CORS_HEADERS
 
 app = Flask(__name__)
 app.config.from_object(Config)
@@ -17,9 +18,7 @@ resume_analyzer = ResumeAnalyzer()
 # Add CORS headers
 @app.after_request
 def after_request(response):
-    response.headers.add('Access-Control-Allow-Origin', '*')
-    response.headers.add('Access-Control-Allow-Headers', 'Content-Type,Authorization')
-    response.headers.add('Access-Control-Allow-Methods', 'GET,PUT,POST,DELETE,OPTIONS')
+    response.headers.update(CORS_HEADERS)
     return response
 
 @app.route('/')
@@ -35,14 +34,15 @@ def analyze_resume():
         file = request.files['resume']
         if file and allowed_file(file.filename):
             try:
-                # Save file
+                # Analyze resume from the upload stream (spooled by Werkzeug), not a saved copy
+                analysis = resume_analyzer.analyze_resume_stream(file.stream, file.filename)
+                
+                # Keep a copy of the upload
                 filename = secrets.token_hex(8) + '_' + file.filename
                 filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
+                file.stream.seek(0)
                 file.save(filepath)
                 
-                # Analyze resume
-                analysis = resume_analyzer.analyze_resume_file(filepath)
-                
                 # Store analysis in session
                 session['resume_analysis'] = analysis
                 session['resume_file'] = filename
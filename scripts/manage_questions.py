@@ -5,10 +5,16 @@ Usage examples:
   - List roles: python3 scripts/manage_questions.py list-roles
   - List questions for a role: python3 scripts/manage_questions.py list --role software_engineer
   - Add question: python3 scripts/manage_questions.py add --role software_engineer --question "What is X?" --type technical --difficulty medium
+  - Add many questions (one per line, loaded and saved once): python3 scripts/manage_questions.py add-many --role software_engineer --file questions.txt
 """
 import argparse
 import json
 from pathlib import Path
+try:
+    import orjson
+    ORJSON_SUPPORT = True
+except ImportError:
+    ORJSON_SUPPORT = False
 
 QUESTIONS_FILE = Path('data/questions/interview_questions.json')
 
@@ -21,7 +27,10 @@ def load_questions():
 
 
 def save_questions(data):
-    QUESTIONS_FILE.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding='utf-8')
+    if ORJSON_SUPPORT:
+        QUESTIONS_FILE.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        QUESTIONS_FILE.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding='utf-8')
 
 
 def list_roles():
@@ -43,20 +52,35 @@ def list_questions(role):
         print(f"{i}. {q_text} ({q.get('type','?')}, {q.get('difficulty','?')})")
 
 
-def add_question(role, question, qtype='technical', difficulty='medium'):
-    data = load_questions()
-    if role not in data:
-        data[role] = []
-    new_q = {
+def _append_question(data, role, question, qtype, difficulty):
+    data.setdefault(role, []).append({
         'question': question.strip(),
         'type': qtype,
         'difficulty': difficulty
-    }
-    data[role].append(new_q)
+    })
+
+
+def add_question(role, question, qtype='technical', difficulty='medium'):
+    data = load_questions()
+    _append_question(data, role, question, qtype, difficulty)
     save_questions(data)
     print(f"Added question to role '{role}': {question}")
 
 
+def add_many_questions(role, questions_path, qtype='technical', difficulty='medium'):
+    """Append every non-blank line of a text file as a question, loading/saving the bank once"""
+    questions = [line.strip() for line in Path(questions_path).read_text(encoding='utf-8').splitlines()]
+    questions = [q for q in questions if q]
+    if not questions:
+        print(f"No questions found in {questions_path}")
+        return
+    data = load_questions()
+    for question in questions:
+        _append_question(data, role, question, qtype, difficulty)
+    save_questions(data)
+    print(f"Added {len(questions)} questions to role '{role}'")
+
+
 def main():
     parser = argparse.ArgumentParser()
     sub = parser.add_subparsers(dest='cmd')
@@ -72,6 +96,12 @@ def main():
     add_parser.add_argument('--type', default='technical')
     add_parser.add_argument('--difficulty', default='medium')
 
+    add_many_parser = sub.add_parser('add-many')
+    add_many_parser.add_argument('--role', required=True)
+    add_many_parser.add_argument('--file', required=True)
+    add_many_parser.add_argument('--type', default='technical')
+    add_many_parser.add_argument('--difficulty', default='medium')
+
     args = parser.parse_args()
 
     if args.cmd == 'list-roles':
@@ -80,6 +110,8 @@ def main():
         list_questions(args.role)
     elif args.cmd == 'add':
         add_question(args.role, args.question, args.type, args.difficulty)
+    elif args.cmd == 'add-many':
+        add_many_questions(args.role, args.file, args.type, args.difficulty)
     else:
         parser.print_help()
 
@@ -1,40 +1,85 @@
 import pytest
 from interview_app import app
 
-@pytest.fixture
-def client():
-    app.config['TESTING'] = True
-    with app.test_client() as client:
-        yield client
+app.config['TESTING'] = True
+
+# Route tests only check status/body, so dispatch straight through the app
+# inside a bare request context instead of going through a test client
+@pytest.fixture(scope="module")
+def dispatch():
+    def _dispatch(path):
+        with app.test_request_context(path):
+            return app.full_dispatch_request()
+    with app.app_context():
+        yield _dispatch
 
 
-def test_devtools_probe(client):
-    r = client.get('/.well-known/appspecific/com.chrome.devtools.json')
+def test_devtools_probe(dispatch):
+    r = dispatch('/.well-known/appspecific/com.chrome.devtools.json')
     assert r.status_code in (200, 204)
 
 
-def test_get_role_questions(client):
-    r = client.get('/api/questions/software_engineer')
+def test_get_role_questions(dispatch):
+    r = dispatch('/api/questions/software_engineer')
     assert r.status_code == 200
     data = r.get_json()
     assert data['role'] == 'software_engineer'
     assert 'questions' in data
 
 
-def test_session_questions_empty(client):
-    r = client.get('/api/session/questions')
+def test_session_questions_empty(dispatch):
+    r = dispatch('/api/session/questions')
     assert r.status_code == 404
 
 
-def test_questions_source_no_session(client):
-    r = client.get('/api/questions_source')
+def test_questions_source_no_session(dispatch):
+    r = dispatch('/api/questions_source')
     assert r.status_code == 200
     data = r.get_json()
     assert data['questions_source'] is None
 
 
-def test_well_known_catch_all(client):
+def test_well_known_catch_all(dispatch):
     # Any /.well-known/* path should return 200 and not 404
-    r = client.get('/.well-known/this/is/a/test.json')
+    r = dispatch('/.well-known/this/is/a/test.json')
     assert r.status_code == 200
     assert r.get_data(as_text=True).strip() in ('{}', '')
+
+
+def test_session_round_trips_tagged_values():
+    with app.test_client() as client:
+        with client.session_transaction() as sess:
+            sess['pair'] = (1, 2)
+        with client.session_transaction() as sess:
+            assert sess['pair'] == (1, 2)
+
+
+def test_results_feedback_regenerated_when_answers_change(monkeypatch, tmp_path):
+    import json
+    import interview_app
+    # results() writes data/predictions/*.json relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    calls = []
+    monkeypatch.setattr(interview_app.ai_interviewer, '_generate_overall_feedback',
+                        lambda responses, resume_analysis: calls.append(1) or f"feedback {len(calls)}")
+
+    def saved_feedback():
+        (prediction,) = (tmp_path / 'data' / 'predictions').iterdir()
+        return json.loads(prediction.read_text())['overall_feedback']
+
+    with app.test_client() as client:
+        with client.session_transaction() as sess:
+            sess['interview_id'] = 'results-test'
+            sess['score'] = 6
+            sess['responses'] = [{'question': 'Q1', 'answer': 'A1', 'score': 6}]
+        assert client.get('/results').status_code == 200
+        assert client.get('/results').status_code == 200
+        assert calls == [1] and saved_feedback() == 'feedback 1'
+
+        # Replacing the answer keeps the response count but must not reuse the feedback
+        with client.session_transaction() as sess:
+            sess['responses'] = [{'question': 'Q1', 'answer': 'A1 revised', 'score': 8}]
+        assert client.get('/results').status_code == 200
+        assert saved_feedback() == 'feedback 2'
+        with client.session_transaction() as sess:
+            assert 'overall_feedback' not in sess
@@ -0,0 +1,185 @@
+import gc
+import json
+import sqlite3
+import threading
+import time
+import weakref
+import pytest
+from models.interview_db import InterviewDatabase, dump_json, load_json
+
+@pytest.fixture
+def db(tmp_path):
+    database = InterviewDatabase(str(tmp_path / 'interviews.db'))
+    yield database
+    database.close()
+
+
+def test_finalize_interview_single_update(db):
+    interview_id = db.create_interview('Alice')
+    first = {'question_index': 0, 'question': 'Q1', 'answer': 'A1', 'score': 7}
+    last = {'question_index': 1, 'question': 'Q2', 'answer': 'A2', 'score': 7}
+    db.add_response(interview_id, 0, first)
+    db.finalize_interview(interview_id, 7.0, 2, 5, last, {'skills': ['python']})
+
+    interview = db.get_interview(interview_id)
+    assert interview['status'] == 'completed'
+    assert interview['overall_score'] == 7.0
+    assert interview['completed_questions'] == 2
+    assert interview['total_questions'] == 5
+    assert interview['end_time']
+    assert db.get_responses(interview_id) == [first, last]
+    assert json.loads(interview['resume_analysis']) == {'skills': ['python']}
+
+
+def test_finalize_interview_keeps_existing_resume_analysis(db):
+    interview_id = db.create_interview('Bob')
+    db.save_resume_analysis(interview_id, {'skills': ['java']})
+    db.finalize_interview(interview_id, 5.0, 1, 1)
+
+    interview = db.get_interview(interview_id)
+    assert json.loads(interview['resume_analysis']) == {'skills': ['java']}
+
+
+def test_save_session_updates_given_columns(db):
+    interview_id = db.create_interview('Carol')
+    db.save_session(interview_id, job_role='data_scientist', resume_analysis={'skills': []})
+
+    interview = db.get_interview(interview_id)
+    assert interview['job_role'] == 'data_scientist'
+    assert json.loads(interview['resume_analysis']) == {'skills': []}
+
+
+def test_save_session_rejects_unknown_columns(db):
+    interview_id = db.create_interview('Dave')
+    with pytest.raises(ValueError):
+        db.save_session(interview_id, id=99)
+
+
+def test_add_response_and_bulk_replace(db):
+    interview_id = db.create_interview('Grace')
+    first = {'question_index': 0, 'question': 'Q1', 'answer': 'A1', 'score': 6, 'feedback': 'ok'}
+    second = {'question_index': 1, 'question': 'Q2', 'answer': 'A2', 'score': 8}
+    db.add_response(interview_id, 1, second)
+    db.add_response(interview_id, 0, first)
+    assert db.get_responses(interview_id) == [first, second]
+
+    db.save_responses_bulk(interview_id, [second])
+    assert db.get_responses(interview_id) == [second]
+
+    db.delete_interview(interview_id)
+    assert db.get_responses(interview_id) == []
+
+
+def test_score_distribution_bins(db):
+    for score in (1.0, 3.9, 4.0, 7.5, 8.0, 10.0):
+        interview_id = db.create_interview('Eve')
+        db.update_interview_score(interview_id, score, 1, 1)
+    db.create_interview('In Progress')
+
+    assert db.get_score_distribution() == {'0-2': 1, '2-4': 1, '4-6': 1, '6-8': 1, '8-10': 2}
+
+
+def test_stats_cache_invalidated_on_write(db):
+    assert db.get_interview_stats()['total_interviews'] == 0
+    db.create_interview('Frank')
+    assert db.get_interview_stats()['total_interviews'] == 1
+    assert db.get_job_role_stats()[0]['total'] == 1
+
+
+def test_json_column_helpers_round_trip():
+    data = {'skills': ['python'], 'score': 7.5, 'name': 'Zoë'}
+    assert load_json(dump_json(data)) == data
+    assert load_json(None, []) == []
+    assert load_json('not json', {}) == {}
+
+
+def test_list_queries_skip_json_columns(db):
+    interview_id = db.create_interview('Heidi')
+    db.finalize_interview(interview_id, 9.0, 1, 1, {'question': 'Q1', 'score': 9}, {'skills': []})
+
+    listed = db.get_all_interviews()[0]
+    assert listed['candidate_name'] == 'Heidi'
+    assert 'responses' not in listed and 'resume_analysis' not in listed
+    assert 'responses' not in db.get_recent_interviews()[0]
+
+    full = db.get_interview_full(interview_id)
+    assert full['responses'] == [{'question': 'Q1', 'score': 9}]
+    assert full['resume_analysis'] == {'skills': []}
+
+
+def test_status_and_timestamps_stored_as_integers(db):
+    interview_id = db.create_interview('Ivan')
+    db.save_session(interview_id, status='failed', end_time='2024-01-02T03:04:05')
+
+    with db.get_connection() as conn:
+        row = conn.execute('SELECT status, start_time, end_time, created_at FROM interviews').fetchone()
+    assert all(isinstance(value, int) for value in row)
+
+    interview = db.get_interview(interview_id)
+    assert interview['status'] == 'failed'
+    assert interview['end_time'] == '2024-01-02T03:04:05'
+    assert db.get_interview_stats()['failed_interviews'] == 1
+
+
+def test_text_schema_migrated_on_open(tmp_path, monkeypatch):
+    # A non-UTC zone, so local/UTC mix-ups show up
+    monkeypatch.setenv('TZ', 'America/New_York')
+    time.tzset()
+    path = str(tmp_path / 'legacy.db')
+    conn = sqlite3.connect(path)
+    conn.execute('''
+        CREATE TABLE interviews (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, candidate_name TEXT NOT NULL,
+            job_role TEXT DEFAULT 'software_engineer', total_questions INTEGER DEFAULT 0,
+            completed_questions INTEGER DEFAULT 0, overall_score REAL DEFAULT 0.0,
+            status TEXT DEFAULT 'in_progress', start_time TEXT, end_time TEXT,
+            responses TEXT, resume_analysis TEXT, created_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    conn.execute("INSERT INTO interviews (candidate_name, status, start_time, end_time, created_at) "
+                 "VALUES ('Judy', 'completed', '2024-01-02T03:04:05.123456', '2024-01-02T03:30:00', "
+                 "'2024-01-02 08:04:05')")
+    conn.commit()
+    conn.close()
+
+    database = InterviewDatabase(path)
+    try:
+        interview = database.get_interview(1)
+        assert interview['status'] == 'completed'
+        assert interview['start_time'] == '2024-01-02T03:04:05'
+        assert interview['end_time'] == '2024-01-02T03:30:00'
+        assert interview['created_at'] == '2024-01-02 08:04:05'
+        assert database.get_all_interviews()[0]['created_at'] == '2024-01-02 08:04:05'
+    finally:
+        database.close()
+        monkeypatch.undo()
+        time.tzset()
+
+
+def test_connections_pooled_across_threads(db):
+    seen = []
+
+    def use():
+        with db.get_connection() as conn:
+            with db.get_connection() as nested:
+                assert nested is conn
+            seen.append(conn)
+
+    for _ in range(3):
+        thread = threading.Thread(target=use)
+        thread.start()
+        thread.join()
+    assert seen[0] is seen[1] is seen[2]
+
+
+def test_collected_instance_closes_its_connections(tmp_path):
+    database = InterviewDatabase(str(tmp_path / 'interviews.db'))
+    with database.get_connection() as conn:
+        pass
+    ref = weakref.ref(database)
+    del database
+    gc.collect()
+
+    assert ref() is None
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute('SELECT 1')
@@ -0,0 +1,66 @@
+import json
+import sys
+import pytest
+from scripts import manage_questions
+
+
+@pytest.fixture
+def bank(tmp_path, monkeypatch):
+    path = tmp_path / 'interview_questions.json'
+    path.write_text(json.dumps({'software_engineer': [
+        {'question': 'What is X?', 'type': 'technical', 'difficulty': 'easy'}
+    ]}), encoding='utf-8')
+    monkeypatch.setattr(manage_questions, 'QUESTIONS_FILE', path)
+
+    saves = []
+    save_questions = manage_questions.save_questions
+    monkeypatch.setattr(manage_questions, 'save_questions', lambda data: (saves.append(data), save_questions(data)))
+    return path, saves
+
+
+def _run(monkeypatch, *argv):
+    monkeypatch.setattr(sys, 'argv', ['manage_questions.py', *argv])
+    manage_questions.main()
+
+
+def test_add_many_skips_blank_lines_and_saves_once(bank, tmp_path, monkeypatch):
+    path, saves = bank
+    questions = tmp_path / 'questions.txt'
+    questions.write_text('  What is Y?  \n\n   \nWhat is Z?\n', encoding='utf-8')
+
+    _run(monkeypatch, 'add-many', '--role', 'software_engineer', '--file', str(questions))
+
+    assert len(saves) == 1
+    added = json.loads(path.read_text(encoding='utf-8'))['software_engineer'][1:]
+    assert added == [
+        {'question': 'What is Y?', 'type': 'technical', 'difficulty': 'medium'},
+        {'question': 'What is Z?', 'type': 'technical', 'difficulty': 'medium'},
+    ]
+
+
+def test_add_many_creates_missing_role_with_given_type(bank, tmp_path, monkeypatch):
+    path, saves = bank
+    questions = tmp_path / 'questions.txt'
+    questions.write_text('Tell me about a conflict.\n', encoding='utf-8')
+
+    _run(monkeypatch, 'add-many', '--role', 'data_scientist', '--file', str(questions),
+         '--type', 'behavioral', '--difficulty', 'hard')
+
+    data = json.loads(path.read_text(encoding='utf-8'))
+    assert data['data_scientist'] == [
+        {'question': 'Tell me about a conflict.', 'type': 'behavioral', 'difficulty': 'hard'}
+    ]
+    assert len(data['software_engineer']) == 1
+    assert len(saves) == 1
+
+
+def test_add_many_blank_file_does_not_save(bank, tmp_path):
+    path, saves = bank
+    questions = tmp_path / 'questions.txt'
+    questions.write_text('\n  \n', encoding='utf-8')
+    before = path.read_text(encoding='utf-8')
+
+    manage_questions.add_many_questions('software_engineer', questions)
+
+    assert saves == []
+    assert path.read_text(encoding='utf-8') == before
@@ -0,0 +1,102 @@
+import io
+import os
+import pytest
+from docx import Document
+from models.resume_analyzer import ResumeAnalyzer, PDF_SUPPORT
+import resume_analyzer_app
+
+TEXT = 'Python developer with a Bachelor degree'
+
+
+def _pdf_bytes(text):
+    """Smallest single-page PDF whose content stream draws text"""
+    stream = f'BT /F1 12 Tf 72 720 Td ({text}) Tj ET'.encode('latin-1')
+    objects = [
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        b'<< /Type /Pages /Kids [3 0 R] /Count 1 >>',
+        b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] '
+        b'/Resources << /Font << /F1 5 0 R >> >> /Contents 4 0 R >>',
+        b'<< /Length %d >>\nstream\n' % len(stream) + stream + b'\nendstream',
+        b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>',
+    ]
+    out = io.BytesIO()
+    out.write(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(out.tell())
+        out.write(b'%d 0 obj\n' % number + body + b'\nendobj\n')
+    xref = out.tell()
+    out.write(b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1))
+    out.writelines(b'%010d 00000 n \n' % offset for offset in offsets)
+    out.write(b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref))
+    return out.getvalue()
+
+
+def _docx_bytes(text):
+    doc = Document()
+    doc.add_paragraph(text)
+    out = io.BytesIO()
+    doc.save(out)
+    return out.getvalue()
+
+
+@pytest.fixture
+def analyzer(monkeypatch):
+    analyzer = ResumeAnalyzer()
+    # Keep analysis offline: fall back to the local scoring and recommendations
+    monkeypatch.setattr(analyzer, '_predict_scores_with_hf', lambda text, skills: None)
+    monkeypatch.setattr(analyzer, '_generate_recommendations_with_hf', lambda analysis: None)
+    return analyzer
+
+
+def test_parse_txt_stream(analyzer):
+    assert analyzer.parse_resume_stream(io.BytesIO(TEXT.encode('utf-8')), 'cv.TXT') == TEXT
+
+
+def test_parse_txt_stream_tolerates_non_utf8(analyzer):
+    assert analyzer.parse_resume_stream(io.BytesIO(b'caf\xe9'), 'cv.txt') == 'caf�'
+
+
+def test_parse_docx_stream(analyzer):
+    assert analyzer.parse_resume_stream(io.BytesIO(_docx_bytes(TEXT)), 'cv.docx').strip() == TEXT
+
+
+@pytest.mark.skipif(not PDF_SUPPORT, reason='PyPDF2 not installed')
+def test_parse_pdf_stream(analyzer):
+    assert TEXT in analyzer.parse_resume_stream(io.BytesIO(_pdf_bytes(TEXT)), 'cv.pdf')
+
+
+def test_parse_resume_path_matches_stream(analyzer, tmp_path):
+    path = tmp_path / 'cv.docx'
+    path.write_bytes(_docx_bytes(TEXT))
+    assert analyzer.parse_resume(str(path)) == analyzer.parse_resume_stream(io.BytesIO(path.read_bytes()), 'cv.docx')
+
+
+def test_parse_stream_rejects_unknown_format(analyzer):
+    with pytest.raises(ValueError):
+        analyzer.parse_resume_stream(io.BytesIO(b''), 'cv.odt')
+
+
+def test_analyze_resume_stream(analyzer):
+    analysis = analyzer.analyze_resume_stream(io.BytesIO(TEXT.encode('utf-8')), 'cv.txt')
+    assert 'Python' in analysis['skills']['programming']
+    assert analysis['word_count'] == len(TEXT.split())
+
+
+def test_upload_route_analyzes_and_keeps_copy(analyzer, monkeypatch, tmp_path):
+    app = resume_analyzer_app.app
+    monkeypatch.setattr(resume_analyzer_app, 'resume_analyzer', analyzer)
+    monkeypatch.setitem(app.config, 'UPLOAD_FOLDER', str(tmp_path))
+    upload = _docx_bytes(TEXT)
+
+    with app.test_client() as client:
+        r = client.post('/analyze_resume', data={'resume': (io.BytesIO(upload), 'cv.docx')},
+                        content_type='multipart/form-data')
+        assert r.status_code == 200
+        with client.session_transaction() as sess:
+            saved = sess['resume_file']
+            assert 'Python' in sess['resume_analysis']['skills']['programming']
+
+    # The stream is rewound after analysis, so the archived copy is the whole upload
+    assert os.listdir(tmp_path) == [saved]
+    assert (tmp_path / saved).read_bytes() == upload
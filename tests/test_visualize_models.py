@@ -0,0 +1,74 @@
+import os
+import pytest
+from PIL import Image
+from visualize_models import HiringProcessComparator, _dpi_from_env, _output_is_current, save_figure
+
+
+@pytest.fixture
+def comparator():
+    comparator = HiringProcessComparator()
+    comparator.create_main_comparison_dashboard()
+    yield comparator
+    comparator._close_dashboard()
+
+
+def test_update_dashboard_labelled_chart(comparator):
+    comparator.update_dashboard({'time_efficiency': {'ai': [1, 2, 3]}})
+
+    bars, labels = comparator._artists['time_efficiency']['ai']
+    assert [bar.get_height() for bar in bars] == [1, 2, 3]
+    assert [label.get_text() for label in labels] == ['1.0', '2.0', '3.0']
+    manual = [bar.get_height() for bar in comparator._artists['time_efficiency']['manual'][0]]
+    deltas = [delta.get_text() for delta in comparator._artists['time_efficiency']['delta']]
+    assert deltas == [f'↓{(m - a) / m * 100:.0f}%' for m, a in zip(manual, [1, 2, 3])]
+
+
+def test_update_dashboard_unlabelled_chart(comparator):
+    comparator.update_dashboard({'bias_reduction': {'ai': [5] * 5}})
+
+    artists = comparator._artists['bias_reduction']
+    assert [bar.get_height() for bar in artists['ai'][0]] == [5] * 5
+    manual = [bar.get_height() for bar in artists['manual'][0]]
+    assert [delta.get_text() for delta in artists['delta']] == [f'↓{(m - 5) / m * 100:.0f}%' for m in manual]
+
+
+def test_update_dashboard_rejects_wrong_length(comparator):
+    with pytest.raises(ValueError):
+        comparator.update_dashboard({'bias_reduction': {'ai': [5, 5]}})
+    heights = [bar.get_height() for bar in comparator._artists['bias_reduction']['ai'][0]]
+    assert heights == comparator._chart_arrays['bias_ai'].tolist()
+
+
+def test_dashboard_saves_keep_cache_sidecar_in_step(comparator, tmp_path):
+    path = str(tmp_path / 'dashboard.png')
+    key = comparator.dashboard_key()
+
+    comparator.create_main_comparison_dashboard(path)  # re-save of the built figure
+    assert _output_is_current(path, key)
+
+    comparator.update_dashboard({'bias_reduction': {'ai': [5] * 5}}, path)
+    assert not os.path.exists(path + '.hash')
+
+    comparator.create_main_comparison_dashboard(path)
+    assert not _output_is_current(path, key)
+
+
+def test_tight_resave_after_update_matches_fresh_crop(comparator, tmp_path):
+    fig = comparator._dashboard_fig
+    comparator.create_main_comparison_dashboard(str(tmp_path / 'first.png'), dpi=50, tight=True)
+
+    comparator.update_dashboard({'accuracy': {'ai': [400, 400, 400]}},
+                                str(tmp_path / 'updated.png'), dpi=50, tight=True)
+    save_figure(fig, str(tmp_path / 'fresh.png'), 50, tight=True)
+
+    with Image.open(tmp_path / 'updated.png') as updated, Image.open(tmp_path / 'fresh.png') as fresh:
+        assert updated.size == fresh.size
+
+
+@pytest.mark.parametrize('value, expected', [(None, 150), ('120', 120), ('abc', 150), ('0', 150), ('-72', 150)])
+def test_dpi_from_env(monkeypatch, value, expected):
+    if value is None:
+        monkeypatch.delenv('VISUALIZE_DPI', raising=False)
+    else:
+        monkeypatch.setenv('VISUALIZE_DPI', value)
+    assert _dpi_from_env() == expected
@@ -18,4 +18,11 @@ SCORE_RANGES = {
     'good': (60, 79),
     'average': (40, 59),
     'poor': (0, 39)
+}
+
+# Added to every response (microphone/camera access from other origins)
+CORS_HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Headers': 'Content-Type,Authorization',
+    'Access-Control-Allow-Methods': 'GET,PUT,POST,DELETE,OPTIONS'
 }
\ No newline at end of file
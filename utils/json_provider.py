@@ -0,0 +1,29 @@
+try:
+    import orjson
+    ORJSON_SUPPORT = True
+except ImportError:
+    ORJSON_SUPPORT = False
+from flask.json.provider import DefaultJSONProvider
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson (serializes numpy scalars/arrays natively)"""
+
+    def dumps(self, obj, **kwargs):
+        # Leave dates to self.default so they keep Flask's HTTP-date format
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+        except orjson.JSONEncodeError:
+            # Fall back to the stdlib encoder for values orjson rejects (e.g. huge ints)
+            return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        # The session serializer passes object_hook to untag tuples, datetimes, etc.
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)